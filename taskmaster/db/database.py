@@ -5,13 +5,165 @@ This module handles all database operations for the application.
 """
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Tuple
+from datetime import datetime, timedelta
 
 from ..models.task import Task, Priority, Status
 
 
+# Run ``PRAGMA optimize`` after this many committed writes so the query
+# planner statistics stay fresh without paying for it on every save.
+OPTIMIZE_EVERY_N_WRITES = 100
+
+# Separator used when aggregating tag names with GROUP_CONCAT. The ASCII
+# unit separator cannot be typed into a tag name.
+TAG_SEPARATOR = '\x1f'
+
+# Statuses are stored as small integers. The codes are fixed explicitly so
+# reordering the Status enum can never reinterpret existing rows.
+STATUS_CODES = {
+    Status.TODO: 0,
+    Status.IN_PROGRESS: 1,
+    Status.COMPLETED: 2,
+    Status.ARCHIVED: 3,
+}
+STATUSES_BY_CODE = {code: status for status, code in STATUS_CODES.items()}
+
+# Plain dict lookups are cheaper than calling Priority(value) for every row
+PRIORITIES_BY_VALUE = {priority.value: priority for priority in Priority}
+
+# Priorities are stored as their enum value and all timestamps as Unix
+# epoch seconds, which keeps rows compact and due dates range-searchable.
+# search_text holds the lowercased title, description and tags so searches
+# need no per-row case conversion or join against the tags. title_key holds
+# title.lower() so titles sort like Python does; SQLite's NOCASE only folds
+# ASCII letters.
+TASKS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        priority INTEGER NOT NULL,
+        status INTEGER NOT NULL,
+        due_date INTEGER,
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        search_text TEXT NOT NULL DEFAULT '',
+        title_key TEXT NOT NULL DEFAULT ''
+    )
+'''
+
+SCHEMA_SQL = f'''
+    BEGIN;
+    
+    {TASKS_TABLE_SQL.format(table='tasks').strip()};
+    
+    CREATE TABLE IF NOT EXISTS tags (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL
+    );
+    
+    CREATE TABLE IF NOT EXISTS task_tags (
+        task_id INTEGER,
+        tag_id INTEGER,
+        PRIMARY KEY (task_id, tag_id),
+        FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+        FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE
+    );
+    
+    -- Indexes for status filtering, due date ranges, the title sort and
+    -- tag lookups
+    CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+    CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks (due_date);
+    CREATE INDEX IF NOT EXISTS idx_tasks_title_key ON tasks (title_key, id);
+    CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags (tag_id);
+    
+    COMMIT;
+'''
+
+# Statement text is kept in module constants so every call hands the exact
+# same string to sqlite3, which then reuses the compiled statement from the
+# connection's statement cache instead of re-parsing it.
+SQL_INSERT_TASK = '''
+    INSERT INTO tasks (title, description, priority, status, due_date, created_at, updated_at,
+                       search_text, title_key)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_UPDATE_TASK = '''
+    UPDATE tasks
+    SET title = ?, description = ?, priority = ?, status = ?,
+        due_date = ?, updated_at = ?, search_text = ?, title_key = ?
+    WHERE id = ?
+'''
+
+SQL_UPDATE_DERIVED_COLUMNS = 'UPDATE tasks SET search_text = ?, title_key = ? WHERE id = ?'
+
+SQL_DELETE_TASK = 'DELETE FROM tasks WHERE id = ?'
+
+# Tags are aggregated per task so a listing is one query instead of one
+# extra tag lookup per task. The correlated subquery only runs for rows that
+# are returned, so a LIMIT applies before any tags are looked up. Columns
+# are listed explicitly because rows are read by position.
+_SQL_SELECT_TASKS_WITH_TAGS = '''
+    SELECT t.id, t.title, t.description, t.priority, t.status, t.due_date,
+           t.created_at, t.updated_at,
+           (SELECT GROUP_CONCAT(tg.name, CHAR(31))
+            FROM task_tags tt JOIN tags tg ON tg.id = tt.tag_id
+            WHERE tt.task_id = t.id) AS tag_names
+    FROM tasks t
+'''
+
+SQL_SELECT_TASK = _SQL_SELECT_TASKS_WITH_TAGS + 'WHERE t.id = ?'
+SQL_SELECT_TASKS = _SQL_SELECT_TASKS_WITH_TAGS
+SQL_SELECT_TASKS_BY_STATUS = _SQL_SELECT_TASKS_WITH_TAGS + 'WHERE t.status = ?'
+
+# Case-insensitive substring search over a task's title, description and
+# tags, bound to the lowercased search text
+SQL_SEARCH_CONDITION = 'instr(t.search_text, :search) > 0'
+
+# WHERE conditions for the task list filters understood by query_tasks,
+# ANDed together. Their named parameters are bound by query_tasks.
+TASK_FILTER_CONDITIONS = {
+    'all': (),
+    'today': ('t.due_date >= :today', 't.due_date < :tomorrow'),
+    'upcoming': ('t.due_date >= :tomorrow', 't.status != :completed'),
+    'completed': ('t.status = :completed',),
+    'overdue': ('t.due_date < :now', 't.status != :completed'),
+}
+
+# ORDER BY clauses for the sort keys understood by query_tasks. The id
+# breaks ties so the order is stable between queries.
+TASK_SORT_ORDERS = {
+    'due_date': 't.due_date IS NULL, t.due_date, t.id',
+    'priority': 't.priority DESC, t.id',
+    'title': 't.title_key, t.id',
+}
+
+# Number of tasks and of overdue tasks for each status and priority pair
+SQL_COUNT_TASKS = '''
+    SELECT status, priority, COUNT(*),
+           COUNT(CASE WHEN due_date < :now AND status != :completed THEN 1 END)
+    FROM tasks
+    GROUP BY status, priority
+'''
+
+SQL_DELETE_TASK_TAGS = 'DELETE FROM task_tags WHERE task_id = ?'
+SQL_INSERT_TAG = 'INSERT OR IGNORE INTO tags (name) VALUES (?)'
+SQL_INSERT_TASK_TAG = 'INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)'
+
+# Size of the per-connection compiled statement cache
+STATEMENT_CACHE_SIZE = 256
+
+# Rows per transaction in add_tasks_bulk, and names per IN (...) lookup.
+# The latter stays below SQLite's historical limit of 999 bound parameters.
+BULK_INSERT_CHUNK_SIZE = 1000
+TAG_LOOKUP_CHUNK_SIZE = 500
+
+
 class Database:
     """Handles all database operations for TaskMaster Pro."""
     
@@ -29,56 +181,199 @@ class Database:
             db_path = os.path.join(db_dir, 'taskmaster.db')
         
         self.db_path = db_path
+        self._write_count = 0
+        
+        # A single connection is kept open for the lifetime of the instance so
+        # SQLite's page cache stays warm between queries. The lock serializes
+        # access since the connection may be shared across threads.
+        self._lock = threading.RLock()
+        self._conn = self._connect()
         self._init_db()
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Access columns by name
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure the shared database connection."""
+        # isolation_level=None disables the sqlite3 module's implicit
+        # transactions; writes open their own via _transaction().
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        
+        # Per-connection tuning: WAL only needs NORMAL sync to stay durable
+        # across application crashes, and readers wait instead of failing
+        # while a save is in progress.
+        conn.execute('PRAGMA foreign_keys = ON')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute('PRAGMA busy_timeout = 5000')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        conn.execute('PRAGMA cache_size = -20000')  # ~20 MB
         return conn
     
+    def close(self):
+        """Refresh planner statistics and close the database connection."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self.optimize()
+            self._conn.close()
+            self._conn = None
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get the shared connection. Callers must hold the lock.
+        
+        Raises:
+            sqlite3.ProgrammingError: If the database has been closed.
+        """
+        if self._conn is None:
+            raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+        return self._conn
+    
+    def checkpoint(self):
+        """Copy committed WAL pages back into the database file.
+        
+        PASSIVE mode never waits for readers or writers, so this is safe to
+        call from an idle timer. Doing it there keeps the automatic
+        checkpoint from landing in the middle of a user's save.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute('PRAGMA wal_checkpoint(PASSIVE)')
+    
+    def optimize(self):
+        """Let SQLite refresh query planner statistics where they are stale."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute('PRAGMA optimize')
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a block of statements in a single write transaction.
+        
+        BEGIN IMMEDIATE takes the write lock up front, so a transaction never
+        has to be retried halfway through because another writer got there
+        first. The transaction is rolled back if the block raises.
+        
+        Yields:
+            A cursor on the shared connection.
+        """
+        with self._lock:
+            cursor = self._connection().cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                raise
+            cursor.execute('COMMIT')
+    
+    def _record_write(self):
+        """Count a committed write and periodically refresh planner statistics."""
+        with self._lock:
+            self._write_count += 1
+            if self._write_count % OPTIMIZE_EVERY_N_WRITES == 0:
+                self.optimize()
+    
     def _init_db(self):
         """Initialize the database schema if it doesn't exist."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Enable foreign key support
-            cursor.execute('PRAGMA foreign_keys = ON')
-            
-            # Create tasks table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    priority TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    due_date TEXT,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            ''')
-            
-            # Create tags table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS tags (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL
-                )
-            ''')
-            
-            # Create task_tags junction table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS task_tags (
-                    task_id INTEGER,
-                    tag_id INTEGER,
-                    PRIMARY KEY (task_id, tag_id),
-                    FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
-                    FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE
-                )
-            ''')
-            
-            conn.commit()
+        # WAL lets the UI keep reading while a write commits. The journal
+        # mode is persistent, so it only needs to be set once per file.
+        if not self.db_path.endswith(':memory:'):
+            self._conn.execute('PRAGMA journal_mode = WAL')
+            # Checkpoint less eagerly; MainWindow also checkpoints when idle
+            self._conn.execute('PRAGMA wal_autocheckpoint = 2000')
+        
+        # Databases created before the INTEGER column layout or the search
+        # text and title key columns need converting
+        migrated = self._migrate_text_columns()
+        if self._add_derived_columns() or migrated:
+            self._rebuild_derived_columns()
+        
+        # The whole schema is compiled and run as one script in a single
+        # transaction
+        with self._lock:
+            try:
+                self._conn.executescript(SCHEMA_SQL)
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute('ROLLBACK')
+                raise
+    
+    def _migrate_text_columns(self) -> bool:
+        """Convert a tasks table that stores enums and dates as TEXT.
+        
+        SQLite cannot change a column type in place, so the table is rebuilt
+        and the rows are converted in Python.
+        
+        Returns:
+            True if the table was converted, False otherwise.
+        """
+        conn = self._conn
+        # table_info rows are (cid, name, type, notnull, dflt_value, pk)
+        columns = {row[1]: row[2] for row in conn.execute('PRAGMA table_info(tasks)')}
+        if columns.get('priority', '').upper() != 'TEXT':
+            return False
+        
+        def to_timestamp(value):
+            return int(datetime.fromisoformat(value).timestamp()) if value else None
+        
+        rows = [(
+            task_id,
+            title,
+            description,
+            Priority[priority].value,
+            STATUS_CODES[Status(status)],
+            to_timestamp(due_date),
+            to_timestamp(created_at),
+            to_timestamp(updated_at)
+        ) for task_id, title, description, priority, status, due_date, created_at, updated_at
+            in conn.execute('''
+                SELECT id, title, description, priority, status, due_date, created_at, updated_at
+                FROM tasks
+            ''')]
+        
+        # Foreign keys must be off so dropping the old table does not cascade
+        # into task_tags, and the pragma has no effect inside a transaction.
+        conn.execute('PRAGMA foreign_keys = OFF')
+        try:
+            with self._transaction() as cursor:
+                cursor.execute('DROP TABLE IF EXISTS tasks_new')
+                cursor.execute(TASKS_TABLE_SQL.format(table='tasks_new'))
+                cursor.executemany('''
+                    INSERT INTO tasks_new (id, title, description, priority, status,
+                                           due_date, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+                cursor.execute('DROP TABLE tasks')
+                cursor.execute('ALTER TABLE tasks_new RENAME TO tasks')
+        finally:
+            conn.execute('PRAGMA foreign_keys = ON')
+        return True
+    
+    def _add_derived_columns(self) -> bool:
+        """Add the search_text and title_key columns to a tasks table that lacks them.
+        
+        Returns:
+            True if any column was added, False otherwise.
+        """
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(tasks)')]
+        missing = [name for name in ('search_text', 'title_key') if name not in columns]
+        if not columns or not missing:
+            return False
+        
+        with self._transaction() as cursor:
+            for name in missing:
+                cursor.execute(f"ALTER TABLE tasks ADD COLUMN {name} TEXT NOT NULL DEFAULT ''")
+        return True
+    
+    def _rebuild_derived_columns(self):
+        """Recompute the search text and title key of every task."""
+        with self._lock:
+            rows = self._conn.execute(SQL_SELECT_TASKS).fetchall()
+        
+        with self._transaction() as cursor:
+            cursor.executemany(SQL_UPDATE_DERIVED_COLUMNS, [
+                (self._search_text(row[1], row[2], self._split_tags(row[8])), row[1].lower(),
+                 row[0])
+                for row in rows
+            ])
     
     # Task CRUD operations
     def add_task(self, task: Task) -> int:
@@ -90,31 +385,58 @@ class Database:
         Returns:
             The ID of the newly created task.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
+        with self._transaction() as cursor:
             # Insert the task
-            cursor.execute('''
-                INSERT INTO tasks (title, description, priority, status, due_date, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                task.title,
-                task.description,
-                task.priority.name,
-                task.status.value,
-                task.due_date.isoformat() if task.due_date else None,
-                task.created_at.isoformat(),
-                task.updated_at.isoformat()
-            ))
+            cursor.execute(SQL_INSERT_TASK, self._task_values(task))
             
             task_id = cursor.lastrowid
             
             # Add tags
             if task.tags:
                 self._update_task_tags(cursor, task_id, task.tags)
+        
+        self._record_write()
+        return task_id
+    
+    def add_tasks_bulk(self, tasks: List[Task]) -> List[int]:
+        """Add many tasks at once, e.g. when importing.
+        
+        Tasks and their tags are inserted with executemany, committing every
+        BULK_INSERT_CHUNK_SIZE tasks, which is much faster than calling
+        add_task in a loop.
+        
+        Args:
+            tasks: The tasks to add. Each task's id is set once it is stored.
             
-            conn.commit()
-            return task_id
+        Returns:
+            The IDs of the newly created tasks, in the same order.
+        """
+        task_ids = []
+        for start in range(0, len(tasks), BULK_INSERT_CHUNK_SIZE):
+            chunk = tasks[start:start + BULK_INSERT_CHUNK_SIZE]
+            
+            with self._transaction() as cursor:
+                cursor.executemany(SQL_INSERT_TASK, [self._task_values(task) for task in chunk])
+                
+                # The write lock is held for the whole transaction, so the
+                # rows were given consecutive ids ending at the last one
+                last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+                chunk_ids = range(last_id - len(chunk) + 1, last_id + 1)
+                
+                tag_ids = self._get_tag_ids(cursor, [tag for task in chunk for tag in task.tags])
+                cursor.executemany(SQL_INSERT_TASK_TAG, [
+                    (task_id, tag_ids[tag])
+                    for task_id, task in zip(chunk_ids, chunk)
+                    for tag in task.tags
+                ])
+            
+            for task_id, task in zip(chunk_ids, chunk):
+                task.id = task_id
+            task_ids.extend(chunk_ids)
+        
+        if task_ids:
+            self._record_write()
+        return task_ids
     
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by its ID.
@@ -125,24 +447,17 @@ class Database:
         Returns:
             The Task object, or None if not found.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._connection().cursor()
             
-            cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
+            # Fetch the task and its tags in a single query
+            cursor.execute(SQL_SELECT_TASK, (task_id,))
             task_data = cursor.fetchone()
             
             if not task_data:
                 return None
             
-            # Get tags for this task
-            cursor.execute('''
-                SELECT t.name FROM tags t
-                JOIN task_tags tt ON t.id = tt.tag_id
-                WHERE tt.task_id = ?
-            ''', (task_id,))
-            tags = [row['name'] for row in cursor.fetchall()]
-            
-            return self._row_to_task(dict(task_data), tags)
+            return self._rows_to_tasks([task_data])[0]
     
     def update_task(self, task: Task) -> bool:
         """Update an existing task.
@@ -156,34 +471,29 @@ class Database:
         if task.id is None:
             return False
             
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
+        with self._transaction() as cursor:
             # Update the task
-            cursor.execute('''
-                UPDATE tasks
-                SET title = ?, description = ?, priority = ?, status = ?, 
-                    due_date = ?, updated_at = ?
-                WHERE id = ?
-            ''', (
+            cursor.execute(SQL_UPDATE_TASK, (
                 task.title,
                 task.description,
-                task.priority.name,
-                task.status.value,
-                task.due_date.isoformat() if task.due_date else None,
-                datetime.now().isoformat(),
+                task.priority.value,
+                STATUS_CODES[task.status],
+                self._to_timestamp(task.due_date),
+                self._to_timestamp(datetime.now()),
+                self._search_text(task.title, task.description, task.tags),
+                task.title.lower(),
                 task.id
             ))
             
             if cursor.rowcount == 0:
                 return False
             
-            # Update tags
-            if hasattr(task, 'tags') and task.tags is not None:
+            # Update tags. The search text above already includes them.
+            if task.tags is not None:
                 self._update_task_tags(cursor, task.id, task.tags)
-            
-            conn.commit()
-            return True
+        
+        self._record_write()
+        return True
     
     def delete_task(self, task_id: int) -> bool:
         """Delete a task by its ID.
@@ -194,12 +504,13 @@ class Database:
         Returns:
             True if the task was deleted, False otherwise.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
+        with self._transaction() as cursor:
+            cursor.execute(SQL_DELETE_TASK, (task_id,))
             deleted = cursor.rowcount > 0
-            conn.commit()
-            return deleted
+        
+        if deleted:
+            self._record_write()
+        return deleted
     
     def get_all_tasks(self, status: Status = None) -> List[Task]:
         """Get all tasks, optionally filtered by status.
@@ -210,29 +521,117 @@ class Database:
         Returns:
             A list of Task objects.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._connection().cursor()
             
             if status:
-                cursor.execute('SELECT * FROM tasks WHERE status = ?', (status.value,))
+                cursor.execute(SQL_SELECT_TASKS_BY_STATUS, (STATUS_CODES[status],))
             else:
-                cursor.execute('SELECT * FROM tasks')
+                cursor.execute(SQL_SELECT_TASKS)
+            rows = cursor.fetchall()
+        
+        return self._rows_to_tasks(rows)
+    
+    def query_tasks(self, filter_name: str = 'all', search: Optional[str] = None,
+                    sort: str = 'due_date', limit: Optional[int] = None, offset: int = 0,
+                    now: Optional[datetime] = None) -> List[Task]:
+        """Get the tasks matching a task list filter and search text.
+        
+        Filtering, searching, sorting and paging all happen in SQL, so the
+        status and due date indexes do the work and only the requested rows
+        are converted to Task objects.
+        
+        Args:
+            filter_name: One of the keys of TASK_FILTER_CONDITIONS.
+            search: Text to look for in titles, descriptions and tags,
+                ignoring case.
+            sort: One of the keys of TASK_SORT_ORDERS.
+            limit: Maximum number of tasks to return, or None for no limit.
+            offset: Number of matching tasks to skip.
+            now: Reference time for the date based filters. Defaults to the
+                current time.
             
-            tasks = []
-            for row in cursor.fetchall():
-                task_id = row['id']
-                
-                # Get tags for this task
-                cursor.execute('''
-                    SELECT t.name FROM tags t
-                    JOIN task_tags tt ON t.id = tt.tag_id
-                    WHERE tt.task_id = ?
-                ''', (task_id,))
-                tags = [tag_row['name'] for tag_row in cursor.fetchall()]
-                
-                tasks.append(self._row_to_task(dict(row), tags))
+        Returns:
+            A list of Task objects.
+            
+        Raises:
+            ValueError: If filter_name or sort is unknown.
+        """
+        if filter_name not in TASK_FILTER_CONDITIONS:
+            raise ValueError(f"Unknown task filter: {filter_name!r}")
+        if sort not in TASK_SORT_ORDERS:
+            raise ValueError(f"Unknown sort order: {sort!r}")
+        
+        conditions = list(TASK_FILTER_CONDITIONS[filter_name])
+        if search:
+            conditions.append(SQL_SEARCH_CONDITION)
+        
+        # Only a handful of distinct statements can be built here, so they
+        # all stay in the connection's statement cache
+        sql = _SQL_SELECT_TASKS_WITH_TAGS
+        if conditions:
+            sql += 'WHERE ' + ' AND '.join(conditions) + '\n'
+        sql += f'ORDER BY {TASK_SORT_ORDERS[sort]} LIMIT :limit OFFSET :offset'
+        
+        # Statements only read the parameters they use
+        now = now or datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        params = {
+            'now': self._to_timestamp(now),
+            'today': self._to_timestamp(today),
+            'tomorrow': self._to_timestamp(today + timedelta(days=1)),
+            'completed': STATUS_CODES[Status.COMPLETED],
+            'search': search.lower() if search else None,
+            'limit': -1 if limit is None else limit,
+            'offset': offset
+        }
+        
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        
+        return self._rows_to_tasks(rows)
+    
+    def get_task_counts(self, now: Optional[datetime] = None) -> List[Tuple[Status, Priority, int, int]]:
+        """Count the tasks for each status and priority.
+        
+        The counting is done by SQLite, so no Task objects are created.
+        
+        Args:
+            now: Reference time for overdue tasks. Defaults to the current time.
             
-            return tasks
+        Returns:
+            A list of (status, priority, task count, overdue task count)
+            tuples, one for each pair that has tasks.
+        """
+        params = {
+            'now': self._to_timestamp(now or datetime.now()),
+            'completed': STATUS_CODES[Status.COMPLETED]
+        }
+        with self._lock:
+            rows = self._connection().execute(SQL_COUNT_TASKS, params).fetchall()
+        
+        return [(STATUSES_BY_CODE[status], PRIORITIES_BY_VALUE[priority], count, overdue)
+                for status, priority, count, overdue in rows]
+    
+    @staticmethod
+    def _rows_to_tasks(rows: List[tuple]) -> List[Task]:
+        """Convert rows selected with _SQL_SELECT_TASKS_WITH_TAGS to Task objects."""
+        # Rows are read by position with the converters bound to locals, which
+        # keeps per-row work in this hot path to a minimum.
+        fromtimestamp = datetime.fromtimestamp
+        priorities = PRIORITIES_BY_VALUE
+        statuses = STATUSES_BY_CODE
+        return [Task(
+            title=r[1],
+            description=r[2],
+            priority=priorities[r[3]],
+            status=statuses[r[4]],
+            due_date=fromtimestamp(r[5]) if r[5] is not None else None,
+            tags=r[8].split(TAG_SEPARATOR) if r[8] else [],
+            created_at=fromtimestamp(r[6]),
+            updated_at=fromtimestamp(r[7]),
+            id=r[0]
+        ) for r in rows]
     
     # Helper methods
     def _update_task_tags(self, cursor: sqlite3.Cursor, task_id: int, tags: List[str]):
@@ -244,47 +643,82 @@ class Database:
             tags: List of tag names.
         """
         # Remove existing tags
-        cursor.execute('DELETE FROM task_tags WHERE task_id = ?', (task_id,))
+        cursor.execute(SQL_DELETE_TASK_TAGS, (task_id,))
         
         if not tags:
             return
         
-        # Add new tags
-        for tag_name in tags:
-            # Get or create the tag
-            cursor.execute('SELECT id FROM tags WHERE name = ?', (tag_name,))
-            tag_row = cursor.fetchone()
-            
-            if tag_row:
-                tag_id = tag_row['id']
-            else:
-                cursor.execute('INSERT INTO tags (name) VALUES (?)', (tag_name,))
-                tag_id = cursor.lastrowid
+        # Link tags to task
+        tag_ids = self._get_tag_ids(cursor, tags)
+        cursor.executemany(SQL_INSERT_TASK_TAG,
+                           [(task_id, tag_id) for tag_id in tag_ids.values()])
+    
+    def _get_tag_ids(self, cursor: sqlite3.Cursor, tags: List[str]) -> Dict[str, int]:
+        """Get the IDs of the given tags, creating any that don't exist yet.
+        
+        Args:
+            cursor: Database cursor.
+            tags: List of tag names. Duplicates are allowed.
             
-            # Link tag to task
-            cursor.execute('''
-                INSERT OR IGNORE INTO task_tags (task_id, tag_id)
-                VALUES (?, ?)
-            ''', (task_id, tag_id))
+        Returns:
+            A mapping of tag name to tag ID.
+        """
+        names = list(dict.fromkeys(tags))
+        if not names:
+            return {}
+        
+        # Create any missing tags, then look the ids up in batches
+        cursor.executemany(SQL_INSERT_TAG, [(name,) for name in names])
+        tag_ids = {}
+        for start in range(0, len(names), TAG_LOOKUP_CHUNK_SIZE):
+            batch = names[start:start + TAG_LOOKUP_CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(batch))
+            cursor.execute(f'SELECT name, id FROM tags WHERE name IN ({placeholders})', batch)
+            tag_ids.update(cursor.fetchall())
+        return tag_ids
     
     @staticmethod
-    def _row_to_task(row: Dict[str, Any], tags: List[str]) -> Task:
-        """Convert a database row to a Task object."""
-        from datetime import datetime
-        
-        task = Task(
-            title=row['title'],
-            description=row['description'],
-            priority=Priority[row['priority']],
-            status=Status(row['status']),
-            due_date=datetime.fromisoformat(row['due_date']) if row['due_date'] else None,
-            tags=tags,
-            created_at=datetime.fromisoformat(row['created_at']),
-            updated_at=datetime.fromisoformat(row['updated_at'])
+    def _task_values(task: Task) -> tuple:
+        """Get the parameters for SQL_INSERT_TASK from a task."""
+        return (
+            task.title,
+            task.description,
+            task.priority.value,
+            STATUS_CODES[task.status],
+            Database._to_timestamp(task.due_date),
+            Database._to_timestamp(task.created_at),
+            Database._to_timestamp(task.updated_at),
+            Database._search_text(task.title, task.description, task.tags),
+            task.title.lower()
         )
-        task.id = row['id']
-        return task
+    
+    @staticmethod
+    def _search_text(title: str, description: Optional[str], tags: Optional[List[str]]) -> str:
+        """Build the lowercased text that searches are matched against.
+        
+        The fields are joined with TAG_SEPARATOR, which cannot be typed into
+        the search box, so a search never matches across two fields.
+        """
+        return TAG_SEPARATOR.join((title, description or '', *(tags or ()))).lower()
+    
+    @staticmethod
+    def _split_tags(tag_names: Optional[str]) -> List[str]:
+        """Split a GROUP_CONCAT tag string back into a list of tag names."""
+        return tag_names.split(TAG_SEPARATOR) if tag_names else []
+    
+    @staticmethod
+    def _to_timestamp(value: Optional[datetime]) -> Optional[int]:
+        """Convert a datetime to Unix epoch seconds for storage."""
+        return int(value.timestamp()) if value else None
+
+
+# Shared database instance, created on first use by get_db()
+_db_instance: Optional[Database] = None
 
 
-# Create a default database instance
-db = Database()
+def get_db() -> Database:
+    """Return the shared database instance, opening it on first use."""
+    global _db_instance
+    if _db_instance is None:
+        _db_instance = Database()
+    return _db_instance
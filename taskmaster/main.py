@@ -2,24 +2,41 @@
 TaskMaster Pro - Main Application Entry Point
 """
 import sys
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtWidgets import QApplication
 
-from taskmaster.views.main_window import MainWindow
-from taskmaster.utils.settings import Settings
+from taskmaster.utils.settings import get_settings
+from taskmaster.db.database import get_db
+
+
+def _close_db():
+    """Wait for the background task loads to finish and close the database."""
+    QThreadPool.globalInstance().waitForDone()
+    get_db().close()
 
 
 def main():
     """Main application entry point."""
+    # Keep native child windows from forcing their siblings to be native
+    # too, which saves creating platform windows while building the UI
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
+    
     # Initialize the application
     app = QApplication(sys.argv)
     app.setApplicationName("TaskMaster Pro")
     app.setApplicationVersion("1.0.0")
     app.setStyle('Fusion')  # Use Fusion style for a modern look
+    
+    # Flush and close the shared database connection on exit, once no
+    # task loader can still be using it
+    app.aboutToQuit.connect(_close_db)
 
     # Load application settings
-    settings = Settings()
+    settings = get_settings()
     
-    # Create and show the main window
+    # Create and show the main window. The view modules pull in most of Qt,
+    # so they are only imported once the application object exists.
+    from taskmaster.views.main_window import MainWindow
     main_window = MainWindow(settings)
     main_window.show()
     
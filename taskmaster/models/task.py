@@ -3,6 +3,7 @@ Task model for TaskMaster Pro.
 
 This module defines the Task class which represents a single task in the application.
 """
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
 from typing import List, Optional
@@ -23,39 +24,39 @@ class Status(Enum):
     ARCHIVED = "Archived"
 
 
+@dataclass(slots=True, eq=False)
 class Task:
-    """Represents a task in the TaskMaster application."""
+    """Represents a task in the TaskMaster application.
     
-    def __init__(self, 
-                 title: str, 
-                 description: str = "",
-                 priority: Priority = Priority.MEDIUM,
-                 status: Status = Status.TODO,
-                 due_date: Optional[datetime] = None,
-                 tags: Optional[List[str]] = None,
-                 created_at: Optional[datetime] = None,
-                 updated_at: Optional[datetime] = None):
-        """Initialize a new task.
-        
-        Args:
-            title: The title of the task.
-            description: A detailed description of the task.
-            priority: The priority level of the task.
-            status: The current status of the task.
-            due_date: Optional due date for the task.
-            tags: Optional list of tags for categorization.
-            created_at: When the task was created. Defaults to now.
-            updated_at: When the task was last updated. Defaults to now.
-        """
-        self.id: Optional[int] = None  # Will be set by the database
-        self.title = title
-        self.description = description
-        self.priority = priority
-        self.status = status
-        self.due_date = due_date
-        self.tags = tags or []
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+    Attributes:
+        title: The title of the task.
+        description: A detailed description of the task.
+        priority: The priority level of the task.
+        status: The current status of the task.
+        due_date: Optional due date for the task.
+        tags: Optional list of tags for categorization.
+        created_at: When the task was created. Defaults to now.
+        updated_at: When the task was last updated. Defaults to now.
+        id: Database ID of the task. Set by the database once stored.
+    """
+    title: str
+    description: str = ""
+    priority: Priority = Priority.MEDIUM
+    status: Status = Status.TODO
+    due_date: Optional[datetime] = None
+    tags: Optional[List[str]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    id: Optional[int] = None
+    
+    def __post_init__(self):
+        """Fill in defaults that depend on the time of creation."""
+        if self.tags is None:
+            self.tags = []
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = datetime.now()
     
     def __repr__(self) -> str:
         """Return a string representation of the task."""
@@ -78,17 +79,14 @@ class Task:
     @classmethod
     def from_dict(cls, data: dict) -> 'Task':
         """Create a Task instance from a dictionary."""
-        task = cls(
+        return cls(
             title=data['title'],
             description=data.get('description', ''),
             priority=Priority[data.get('priority', 'MEDIUM')],
             status=Status(data.get('status', 'To Do')),
             due_date=datetime.fromisoformat(data['due_date']) if data.get('due_date') else None,
-            tags=data.get('tags', [])
+            tags=data.get('tags', []),
+            created_at=datetime.fromisoformat(data['created_at']) if 'created_at' in data else None,
+            updated_at=datetime.fromisoformat(data['updated_at']) if 'updated_at' in data else None,
+            id=data.get('id')
         )
-        task.id = data.get('id')
-        task.created_at = (datetime.fromisoformat(data['created_at']) 
-                          if 'created_at' in data else datetime.now())
-        task.updated_at = (datetime.fromisoformat(data['updated_at']) 
-                          if 'updated_at' in data else datetime.now())
-        return task
@@ -4,9 +4,16 @@ Settings management for TaskMaster Pro.
 This module handles loading and saving application settings.
 """
 import os
+import copy
 import json
+import functools
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 class Settings:
     """Manages application settings with persistence."""
@@ -51,8 +58,17 @@ class Settings:
             self.filename = filename
             self.settings_dir = os.path.dirname(filename)
         
-        # Initialize with default values
-        self._settings = self.DEFAULTS.copy()
+        # Snapshot of what is on disk, used to skip redundant saves
+        self._last_saved = None
+        
+        # Initialize with default values. A deep copy keeps changes from
+        # leaking into the nested dicts of the class-level DEFAULTS.
+        self._settings = copy.deepcopy(_DEFAULT_TEMPLATE)
+        
+        # Flat 'section.key' -> value mirror of the nested settings, so reads
+        # are a single dict lookup
+        self._flat: Dict[str, Any] = {}
+        self._rebuild_index()
         
         # Load saved settings if they exist
         self.load()
@@ -68,6 +84,8 @@ class Settings:
                 with open(self.filename, 'r', encoding='utf-8') as f:
                     loaded_settings = json.load(f)
                     self._deep_update(self._settings, loaded_settings)
+                self._rebuild_index()
+                self._last_saved = copy.deepcopy(self._settings)
             return True
         except (IOError, json.JSONDecodeError) as e:
             print(f"Error loading settings: {e}")
@@ -76,15 +94,26 @@ class Settings:
     def save(self) -> bool:
         """Save current settings to file.
         
+        Nothing is written if the settings have not changed since they were
+        last loaded or saved. The file is written to a temporary path first
+        and then moved into place, so a crash mid-write cannot corrupt it.
+        
         Returns:
             bool: True if settings were saved successfully, False otherwise.
         """
+        if self._settings == self._last_saved:
+            return True
+        
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.filename), exist_ok=True)
             
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=4, sort_keys=True)
+            tmp_filename = self.filename + '.tmp'
+            with open(tmp_filename, 'wb') as f:
+                f.write(_dumps(self._settings))
+            os.replace(tmp_filename, self.filename)
+            
+            self._last_saved = copy.deepcopy(self._settings)
             return True
         except IOError as e:
             print(f"Error saving settings: {e}")
@@ -100,15 +129,7 @@ class Settings:
         Returns:
             The setting value or default if not found.
         """
-        keys = key.split('.')
-        value = self._settings
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any, save_immediately: bool = False) -> bool:
         """Set a setting value by dot notation key.
@@ -121,7 +142,7 @@ class Settings:
         Returns:
             bool: True if the setting was updated successfully.
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         current = self._settings
         
         try:
@@ -133,6 +154,7 @@ class Settings:
             
             # Set the value
             current[keys[-1]] = value
+            self._update_index(key, keys, value)
             
             # Save if requested
             if save_immediately:
@@ -142,6 +164,36 @@ class Settings:
         except (KeyError, TypeError):
             return False
     
+    def _rebuild_index(self):
+        """Rebuild the flat key index from the nested settings."""
+        self._flat = {}
+        self._index_subtree('', self._settings)
+    
+    def _index_subtree(self, prefix: str, node: Dict):
+        """Add every key below a nested settings dict to the flat index."""
+        for key, value in node.items():
+            path = f'{prefix}.{key}' if prefix else key
+            self._flat[path] = value
+            if isinstance(value, dict):
+                self._index_subtree(path, value)
+    
+    def _update_index(self, key: str, keys: tuple, value: Any):
+        """Refresh the flat index after a single key was set."""
+        # Drop entries that belonged to the value being replaced
+        prefix = key + '.'
+        for path in [path for path in self._flat if path.startswith(prefix)]:
+            del self._flat[path]
+        
+        # Parent sections may have been created on the way down
+        node = self._settings
+        for i, k in enumerate(keys[:-1]):
+            node = node[k]
+            self._flat['.'.join(keys[:i + 1])] = node
+        
+        self._flat[key] = value
+        if isinstance(value, dict):
+            self._index_subtree(key, value)
+    
     def _deep_update(self, original: Dict, update: Dict) -> Dict:
         """Recursively update a dictionary."""
         for key, value in update.items():
@@ -157,7 +209,8 @@ class Settings:
         Returns:
             bool: True if reset was successful.
         """
-        self._settings = self.DEFAULTS.copy()
+        self._settings = copy.deepcopy(_DEFAULT_TEMPLATE)
+        self._rebuild_index()
         return self.save()
     
     def __getitem__(self, key: str) -> Any:
@@ -177,5 +230,29 @@ class Settings:
             return False
 
 
-# Global settings instance
-settings = Settings()
+def _dumps(data: Dict) -> bytes:
+    """Serialize settings to indented, key-sorted JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=128)
+def _split_key(key: str) -> tuple:
+    """Split a dot notation key into its path segments."""
+    return tuple(key.split('.'))
+
+
+# Pristine copy of the defaults that instances are deep-copied from
+_DEFAULT_TEMPLATE = copy.deepcopy(Settings.DEFAULTS)
+
+# Shared settings instance, created on first use by get_settings()
+_settings_instance: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Return the shared settings instance, loading it on first use."""
+    global _settings_instance
+    if _settings_instance is None:
+        _settings_instance = Settings()
+    return _settings_instance
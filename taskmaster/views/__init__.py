@@ -2,6 +2,16 @@
 Views package for TaskMaster Pro.
 
 This package contains all the UI view components for the application.
+Submodules are imported on first attribute access so that importing the
+package does not pull in Qt.
 """
+import importlib
 
-__all__ = ['main_window', 'dialogs', 'widgets']
+__all__ = ['main_window', 'task_loader', 'icon_cache', 'dialogs', 'widgets']
+
+
+def __getattr__(name):
+    """Lazily import view submodules (PEP 562)."""
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
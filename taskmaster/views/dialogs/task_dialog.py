@@ -6,8 +6,6 @@ from PyQt6.QtWidgets import (
     QPushButton, QListWidget, QListWidgetItem, QWidget
 )
 from PyQt6.QtCore import Qt, QDateTime
-from PyQt6.QtGui import QIcon
-import qtawesome as qta
 
 from ...models.task import Task, Priority, Status
 
@@ -15,6 +13,11 @@ from ...models.task import Task, Priority, Status
 class TaskDialog(QDialog):
     """Dialog for creating or editing a task."""
     
+    # (label, value) pairs for the combo boxes, built once per process
+    _PRIORITY_ITEMS = tuple((priority.name.title(), priority) for priority in Priority)
+    _STATUS_ITEMS = tuple((status.value, status) for status in Status)
+    _PRIORITY_LABELS = {priority: label for label, priority in _PRIORITY_ITEMS}
+    
     def __init__(self, task=None, parent=None):
         """Initialize the dialog.
         
@@ -46,16 +49,16 @@ class TaskDialog(QDialog):
         # Priority
         layout.addWidget(QLabel("Priority"))
         self.priority_combo = QComboBox()
-        for priority in Priority:
-            self.priority_combo.addItem(priority.name.title(), priority)
-        self.priority_combo.setCurrentText(self.task.priority.name.title())
+        for label, priority in self._PRIORITY_ITEMS:
+            self.priority_combo.addItem(label, priority)
+        self.priority_combo.setCurrentText(self._PRIORITY_LABELS[self.task.priority])
         layout.addWidget(self.priority_combo)
         
         # Status
         layout.addWidget(QLabel("Status"))
         self.status_combo = QComboBox()
-        for status in Status:
-            self.status_combo.addItem(status.value, status)
+        for label, status in self._STATUS_ITEMS:
+            self.status_combo.addItem(label, status)
         self.status_combo.setCurrentText(self.task.status.value)
         layout.addWidget(self.status_combo)
         
@@ -0,0 +1,42 @@
+"""Icon cache for TaskMaster Pro.
+
+This module memoizes qtawesome icons and the pixmaps rendered from them,
+so each glyph is built and rasterized only once per color and size.
+Icons must only be requested once the QApplication exists.
+"""
+import functools
+
+import qtawesome as qta
+
+
+@functools.lru_cache(maxsize=256)
+def icon(name, color=None):
+    """Get a qtawesome icon.
+    
+    Animated icons are bound to the widget they animate and must not be
+    shared, so they are created with qta.icon directly instead.
+    
+    Args:
+        name: Name of the glyph, e.g. 'fa5s.plus'
+        color: Color of the glyph, or None for the default color
+    
+    Returns:
+        QIcon: The cached icon.
+    """
+    return qta.icon(name) if color is None else qta.icon(name, color=color)
+
+
+@functools.lru_cache(maxsize=256)
+def pixmap(name, color, width, height):
+    """Get a qtawesome icon rendered to a pixmap.
+    
+    Args:
+        name: Name of the glyph, e.g. 'fa5s.trash'
+        color: Color of the glyph, or None for the default color
+        width: Width of the pixmap
+        height: Height of the pixmap
+    
+    Returns:
+        QPixmap: The cached pixmap.
+    """
+    return icon(name, color).pixmap(width, height)
@@ -2,166 +2,195 @@
 
 This module contains the main application window and its components.
 """
-from PyQt6.QtGui import QShortcut
+from datetime import datetime
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QListWidget, QListWidgetItem, QLabel, QFrame, QSplitter,
+    QListView, QLabel, QFrame, QSplitter,
     QToolBar, QStatusBar, QComboBox, QLineEdit, QStyle, QMessageBox,
-    QTabWidget
+    QTabWidget, QButtonGroup, QDialog
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer, QDateTime
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThreadPool
 from PyQt6.QtGui import QIcon, QAction, QPixmap, QColor, QPalette
-import qtawesome as qta
 
-from ..db.database import db
-from ..models.task import Task, Status, Priority
-from .dialogs.task_dialog import TaskDialog
+from ..db.database import get_db
+from ..models.task import Task
 from .widgets.dashboard_widget import DashboardWidget
+from .widgets.task_list import TaskListModel, TaskItemDelegate
+from .task_loader import LoaderParams, TaskLoader
+from . import icon_cache
 
 
-class TaskItemWidget(QWidget):
-    """Custom widget for displaying a task in the task list."""
-    
-    def __init__(self, task, parent=None):
-        super().__init__(parent)
-        self.task = task
-        self.parent = parent  # Store reference to parent for callbacks
-        self.setup_ui()
+# Intervals for background database maintenance
+WAL_CHECKPOINT_INTERVAL_MS = 60 * 1000
+DB_OPTIMIZE_INTERVAL_MS = 15 * 60 * 1000
+
+# Quiet period after the last keystroke before the search is run
+SEARCH_DEBOUNCE_MS = 200
+
+# Sidebar filter buttons: label, icon and the database filter name
+FILTER_OPTIONS = [
+    ("All Tasks", 'fa5s.tasks', 'all'),
+    ("Today", 'fa5s.calendar-day', 'today'),
+    ("Upcoming", 'fa5s.calendar-week', 'upcoming'),
+    ("Completed", 'fa5s.check-double', 'completed'),
+    ("Overdue", 'fa5s.exclamation-triangle', 'overdue')
+]
+
+# Rows the task list lays out per event loop pass
+TASK_LIST_BATCH_SIZE = 50
+
+# Tasks loaded per page; further pages load as the list is scrolled down
+TASK_PAGE_SIZE = 200
+
+# Entries of the sort combo box and the database sort key of each
+SORT_OPTIONS = [
+    ("Due Date", 'due_date'),
+    ("Priority", 'priority'),
+    ("Title", 'title')
+]
+
+
+class MainWindow(QMainWindow):
+    """Main application window for TaskMaster Pro."""
     
-    def setup_ui(self):
-        """Set up the task item UI."""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 5, 10, 5)
-        
-        # Status indicator
-        status_icon = QLabel()
-        status_pixmap = self._get_status_icon()
-        status_icon.setPixmap(status_pixmap)
-        status_icon.setFixedSize(24, 24)
-        
-        # Task title and due date
-        text_layout = QVBoxLayout()
-        self.title_label = QLabel(self.task.title)
-        self.title_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
-        
-        details = []
-        if self.task.due_date:
-            details.append(f"Due: {self.task.due_date.strftime('%b %d, %Y %H:%M')}")
-        if self.task.tags:
-            details.append(f"Tags: {', '.join(self.task.tags)}")
-            
-        self.details_label = QLabel(" • ".join(details))
-        self.details_label.setStyleSheet("color: #666; font-size: 10pt;")
-        
-        text_layout.addWidget(self.title_label)
-        text_layout.addWidget(self.details_label)
-        text_layout.setSpacing(2)
-        
-        # Priority indicator
-        priority_label = QLabel()
-        priority_label.setFixedSize(10, 10)
-        priority_label.setStyleSheet(f"""
-            background-color: {self._get_priority_color()};
+    # Window-wide stylesheets. Widgets are matched by object name, so Qt
+    # parses the rules once per theme switch instead of once per widget.
+    _BASE_QSS = """
+        QLabel#appTitle {
+            font-size: 18px;
+            font-weight: bold;
+            padding: 10px;
+        }
+        QLabel#sectionLabel {
+            font-size: 11px;
+            font-weight: bold;
+            text-transform: uppercase;
+            margin-top: 10px;
+        }
+        QListView#taskList {
+            border: none;
+        }
+        #sidebar QPushButton[filter="true"] {
+            text-align: left;
+            padding: 8px 15px;
             border-radius: 5px;
-        """)
-        
-        # Delete button
-        delete_btn = QPushButton()
-        delete_btn.setIcon(qta.icon('fa5s.trash', color='#ff6b6b'))
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background: transparent;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background: #ffebee;
-            }
-        """)
-        delete_btn.setFixedSize(30, 30)
-        delete_btn.clicked.connect(self.on_delete_clicked)
-        
-        # Add widgets to layout
-        layout.addWidget(status_icon)
-        layout.addLayout(text_layout, 1)
-        layout.addWidget(priority_label)
-        layout.addWidget(delete_btn)
-        
-        # Set up styling
-        self.setAutoFillBackground(True)
-        self.setStyleSheet("""
-            TaskItemWidget {
-                border-bottom: 1px solid #eee;
-                background: white;
-            }
-            TaskItemWidget:hover {
-                background: #f5f5f5;
-            }
-        """)
+            border: none;
+        }
+        #sidebar QPushButton[filter="true"]:checked {
+            font-weight: bold;
+        }
+    """
     
-    def _get_status_icon(self):
-        """Get the appropriate status icon for the task."""
-        if self.task.status == Status.COMPLETED:
-            return qta.icon('fa5s.check-circle', color='#4CAF50').pixmap(24, 24)
-        elif self.task.status == Status.IN_PROGRESS:
-            return qta.icon('fa5s.spinner', color='#2196F3', animation=qta.Spin(self)).pixmap(24, 24)
-        else:
-            return qta.icon('fa5s.circle', color='#9E9E9E').pixmap(24, 24)
+    _LIGHT_QSS = _BASE_QSS + """
+        #sidebar {
+            background: #f8f9fa;
+            border-right: 1px solid #ddd;
+        }
+        QLabel#appTitle {
+            color: #333;
+        }
+        QLabel#sectionLabel {
+            color: #666;
+        }
+        QListView#taskList {
+            background: white;
+        }
+        #sidebar QPushButton[filter="true"]:hover {
+            background: #f0f0f0;
+        }
+        #sidebar QPushButton[filter="true"]:checked {
+            background: #e3f2fd;
+            color: #1976d2;
+        }
+    """
     
-    def _get_priority_color(self):
-        """Get the color for the priority indicator."""
-        colors = {
-            Priority.HIGH: '#F44336',
-            Priority.MEDIUM: '#FFC107',
-            Priority.LOW: '#8BC34A'
+    _DARK_QSS = _BASE_QSS + """
+        QMainWindow {
+            background: #121212;
+            color: #ffffff;
         }
-        return colors.get(self.task.priority, '#9E9E9E')
-        
-    def on_delete_clicked(self):
-        """Handle delete button click."""
-        # Show confirmation dialog
-        reply = QMessageBox.question(
-            self, 'Delete Task',
-            f'Are you sure you want to delete "{self.task.title}"?',
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            # Notify parent to handle the deletion
-            if hasattr(self.parent, 'delete_task'):
-                self.parent.delete_task(self.task.id)
-
-
-class MainWindow(QMainWindow):
-    """Main application window for TaskMaster Pro."""
+        #sidebar {
+            background: #1e1e1e;
+            border-right: 1px solid #333;
+        }
+        QLabel#appTitle {
+            color: #ffffff;
+        }
+        QLabel#sectionLabel {
+            color: #aaa;
+        }
+        QListView#taskList {
+            background: #1e1e1e;
+            color: #ffffff;
+        }
+        #sidebar QPushButton[filter="true"] {
+            color: #ffffff;
+        }
+        #sidebar QPushButton[filter="true"]:hover {
+            background: #2c2c2c;
+        }
+        #sidebar QPushButton[filter="true"]:checked {
+            background: #0d47a1;
+            color: #e3f2fd;
+        }
+    """
     
     def __init__(self, settings):
         super().__init__()
         self.settings = settings
-        self.current_filter = "All Tasks"
+        self.current_filter = 'all'
+        
+        # Incremented for every load of the list or of the dashboard counts,
+        # so results of superseded loads that finish late can be recognized
+        # and dropped
+        self._load_generation = 0
+        self._counts_generation = 0
+        self._load_params = None
+        
         self.setup_ui()
         self.load_tasks()
+        self._refresh_dashboard()
+        
+        # Debounce the search box so a burst of typing reloads the list once.
+        # Restarting a running single-shot timer pushes its timeout back.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(
+            lambda: self.load_tasks(self.search_box.text()))
         
         # Connect signals
-        self.search_box.textChanged.connect(
-            lambda: self.load_tasks(self.search_box.text()))
-        self.sort_combo.currentTextChanged.connect(
+        self.search_box.textChanged.connect(self._search_timer.start)
+        self.sort_combo.currentIndexChanged.connect(
             lambda: self.load_tasks(self.search_box.text()))
         
         # Set up keyboard shortcuts
         self.setup_shortcuts()
+        
+        # Run database maintenance from timers so it never lands on a save
+        self._checkpoint_timer = QTimer(self)
+        self._checkpoint_timer.timeout.connect(get_db().checkpoint)
+        self._checkpoint_timer.start(WAL_CHECKPOINT_INTERVAL_MS)
+        
+        self._optimize_timer = QTimer(self)
+        self._optimize_timer.timeout.connect(get_db().optimize)
+        self._optimize_timer.start(DB_OPTIMIZE_INTERVAL_MS)
     
     def setup_shortcuts(self):
-        """Set up keyboard shortcuts."""
-        # New task
-        new_shortcut = QShortcut("Ctrl+N", self)
-        new_shortcut.activated.connect(self.show_new_task_dialog)
-        
-        # Search
-        search_shortcut = QShortcut("Ctrl+F", self)
-        search_shortcut.activated.connect(self.focus_search)
+        """Set up keyboard shortcuts that have no menu entry.
+        
+        New Task (Ctrl+N) is already bound by its menu action.
+        """
+        shortcuts = [
+            ("Ctrl+F", self.focus_search)
+        ]
+        
+        for key, slot in shortcuts:
+            action = QAction(self)
+            action.setShortcut(key)
+            action.triggered.connect(slot)
+            self.addAction(action)
     
     def focus_search(self):
         """Set focus to the search box."""
@@ -170,14 +199,27 @@ class MainWindow(QMainWindow):
     
     def edit_task(self, task):
         """Edit an existing task."""
+        from .dialogs.task_dialog import TaskDialog
+        
         dialog = TaskDialog(task=task, parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            # The dialog edits the shown task in place, so its row only
+            # needs repainting. The list is still reloaded in the background
+            # since the edit may move the task or take it out of the filter.
             updated_task = dialog.get_task()
-            if db.update_task(updated_task):
+            if get_db().update_task(updated_task):
                 self.statusBar().showMessage("Task updated successfully!", 3000)
-                self.load_tasks()
+                self._refresh_dashboard()
+                self.task_model.refreshTask(updated_task.id)
             else:
                 self.statusBar().showMessage("Failed to update task", 3000)
+            self.load_tasks(self.search_box.text())
+    
+    def _on_task_double_clicked(self, index):
+        """Edit the task of a double-clicked row."""
+        task = index.data(TaskListModel.TaskRole)
+        if task is not None:
+            self.edit_task(task)
     
     def setup_ui(self):
         """Set up the main window UI."""
@@ -226,62 +268,36 @@ class MainWindow(QMainWindow):
         
         # App title
         title = QLabel("TaskMaster Pro")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #333;
-            padding: 10px;
-        """)
+        title.setObjectName("appTitle")
         
         # Add task button
         add_button = QPushButton("New Task")
-        add_button.setIcon(qta.icon('fa5s.plus'))
+        add_button.setIcon(icon_cache.icon('fa5s.plus'))
         add_button.clicked.connect(self.show_new_task_dialog)
         
         # Filter section
         filter_label = QLabel("FILTERS")
-        filter_label.setStyleSheet("""
-            color: #666;
-            font-size: 11px;
-            font-weight: bold;
-            text-transform: uppercase;
-            margin-top: 10px;
-        """)
-        
-        # Filter buttons
-        filters = [
-            ("All Tasks", 'fa5s.tasks'),
-            ("Today", 'fa5s.calendar-day'),
-            ("Upcoming", 'fa5s.calendar-week'),
-            ("Completed", 'fa5s.check-double'),
-            ("Overdue", 'fa5s.exclamation-triangle')
-        ]
+        filter_label.setObjectName("sectionLabel")
         
-        for text, icon in filters:
+        # Filter buttons. One exclusive group keeps a single filter checked
+        # and reports changes by button id, the index into self._filter_names.
+        self._filter_group = QButtonGroup(self)
+        self._filter_group.setExclusive(True)
+        self._filter_names = [filter_name for _, _, filter_name in FILTER_OPTIONS]
+        
+        for button_id, (text, icon, filter_name) in enumerate(FILTER_OPTIONS):
             btn = QPushButton(text)
-            btn.setIcon(qta.icon(icon))
-            btn.setStyleSheet("""
-                QPushButton {
-                    text-align: left;
-                    padding: 8px 15px;
-                    border-radius: 5px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background: #f0f0f0;
-                }
-                QPushButton:checked {
-                    background: #e3f2fd;
-                    color: #1976d2;
-                    font-weight: bold;
-                }
-            """)
+            btn.setIcon(icon_cache.icon(icon))
+            # Styled by the window stylesheet through this property
+            btn.setProperty("filter", True)
             btn.setCheckable(True)
-            if text == "All Tasks":
+            if filter_name == self.current_filter:
                 btn.setChecked(True)
-            btn.clicked.connect(lambda checked, t=text: self.filter_tasks(t))
+            self._filter_group.addButton(btn, button_id)
             layout.addWidget(btn)
         
+        self._filter_group.idToggled.connect(self._on_filter_toggled)
+        
         # Add widgets to sidebar
         layout.addWidget(title)
         layout.addWidget(add_button)
@@ -316,9 +332,10 @@ class MainWindow(QMainWindow):
         self.search_box.setPlaceholderText("Search tasks...")
         self.search_box.setClearButtonEnabled(True)
         
-        # Sort combo
+        # Sort combo. Each entry carries its sort key as item data.
         self.sort_combo = QComboBox()
-        self.sort_combo.addItems(["Due Date", "Priority", "Title"])
+        for label, sort_key in SORT_OPTIONS:
+            self.sort_combo.addItem(label, sort_key)
         
         filter_layout.addWidget(QLabel("Search:"))
         filter_layout.addWidget(self.search_box)
@@ -326,21 +343,23 @@ class MainWindow(QMainWindow):
         filter_layout.addWidget(self.sort_combo)
         filter_layout.addStretch()
         
-        # Task list
-        self.tasks_list = QListWidget()
-        self.tasks_list.setAlternatingRowColors(True)
-        self.tasks_list.setStyleSheet("""
-            QListWidget {
-                border: none;
-                background: white;
-            }
-            QListWidget::item {
-                border-bottom: 1px solid #eee;
-            }
-            QListWidget::item:selected {
-                background: #e3f2fd;
-            }
-        """)
+        # Task list. Rows are painted by the delegate, so no per-task
+        # widgets are created and only visible rows cost anything.
+        self.task_model = TaskListModel(parent=self)
+        self.task_model.fetchMoreRequested.connect(self._load_next_page)
+        self.task_delegate = TaskItemDelegate(self)
+        self.task_delegate.deleteRequested.connect(self.confirm_delete_task)
+        
+        self.tasks_list = QListView()
+        self.tasks_list.setObjectName("taskList")
+        self.tasks_list.setModel(self.task_model)
+        self.tasks_list.setItemDelegate(self.task_delegate)
+        self.tasks_list.setUniformItemSizes(True)
+        # Lay out long lists in batches so the window stays responsive
+        self.tasks_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.tasks_list.setBatchSize(TASK_LIST_BATCH_SIZE)
+        self.tasks_list.setMouseTracking(True)
+        self.tasks_list.doubleClicked.connect(self._on_task_double_clicked)
         
         tasks_layout.addWidget(filter_bar)
         tasks_layout.addWidget(self.tasks_list)
@@ -384,90 +403,163 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about_dialog)
         help_menu.addAction(about_action)
     
+    def _on_filter_toggled(self, button_id, checked):
+        """Apply the filter of the sidebar button that became checked."""
+        # The group also reports the button that was unchecked
+        if checked:
+            self.filter_tasks(self._filter_names[button_id])
+    
+    def filter_tasks(self, filter_name):
+        """Show the tasks matching one of the sidebar filters.
+        
+        Args:
+            filter_name: One of the task filters understood by Database.query_tasks
+        """
+        self.current_filter = filter_name
+        self.load_tasks(self.search_box.text())
+    
     def load_tasks(self, filter_text=None):
-        """Load tasks from the database with optional filtering and sorting."""
-        # Get tasks from database
-        tasks = db.get_tasks()
-        
-        # Apply filters if any
-        if filter_text:
-            filter_text = filter_text.lower()
-            filtered_tasks = [t for t in tasks 
-                           if filter_text in t.title.lower() 
-                           or filter_text in (t.description or '').lower()
-                           or any(filter_text in tag.lower() for tag in t.tags)]
+        """Load tasks with optional filtering and sorting.
+        
+        The tasks are queried on a thread pool worker and displayed by
+        _apply_tasks once the worker is done. Only the first page is loaded,
+        or as many rows as are already shown so the scroll position is kept.
+        
+        Args:
+            filter_text: Text to search for in titles, descriptions and tags
+        """
+        self._load_generation += 1
+        self._load_params = LoaderParams(
+            generation=self._load_generation,
+            filter_name=self.current_filter,
+            filter_text=filter_text,
+            sort_by=self.sort_combo.currentData(),
+            now=datetime.now(),
+            limit=max(TASK_PAGE_SIZE, self.task_model.rowCount())
+        )
+        self._start_loader(self._load_params)
+    
+    def _load_next_page(self, offset):
+        """Load the page of the current list that starts at offset."""
+        if self._load_params is not None:
+            self._start_loader(self._load_params.next_page(offset))
+    
+    def _start_loader(self, params):
+        """Run a TaskLoader with the given parameters on the thread pool."""
+        loader = TaskLoader(params)
+        loader.signals.finished.connect(self._apply_tasks)
+        loader.signals.failed.connect(self._on_load_failed)
+        QThreadPool.globalInstance().start(loader)
+    
+    def _refresh_dashboard(self):
+        """Recount the tasks in the background if the dashboard is showing."""
+        if self.tab_widget.currentIndex() != 0:
+            return
+        
+        self._counts_generation += 1
+        self._start_loader(LoaderParams(
+            generation=self._counts_generation,
+            now=datetime.now(),
+            counts_only=True
+        ))
+    
+    def _apply_tasks(self, params, tasks, task_counts):
+        """Display the results of a finished load."""
+        if params.counts_only:
+            if params.generation == self._counts_generation:
+                self.dashboard.update_stats(task_counts)
+            return
+        
+        # Drop results of a load that has been superseded by a newer one
+        if params.generation != self._load_generation:
+            return
+        
+        # Update tasks list. A full page means there may be more tasks.
+        has_more = params.limit is not None and len(tasks) == params.limit
+        if params.offset:
+            self.task_model.appendTasks(tasks, has_more)
         else:
-            filtered_tasks = tasks
-        
-        # Sort tasks
-        sort_by = self.sort_combo.currentText()
-        if sort_by == "Due Date":
-            filtered_tasks.sort(key=lambda t: (t.due_date is None, t.due_date or QDateTime.currentDateTime()))
-        elif sort_by == "Priority":
-            priority_order = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
-            filtered_tasks.sort(key=lambda t: priority_order.get(t.priority, 3))
-        else:  # Title
-            filtered_tasks.sort(key=lambda t: t.title.lower())
-        
-        # Update tasks list
-        self.update_tasks_list(filtered_tasks)
-        
-        # Update dashboard if it's the current tab
-        if hasattr(self, 'tab_widget') and self.tab_widget.currentIndex() == 0:  # Dashboard tab
-            self.dashboard.update_stats(tasks)  # Use all tasks for dashboard stats
+            self.update_tasks_list(tasks, has_more)
         
         # Update status bar
-        self.statusBar().showMessage(f"Loaded {len(filtered_tasks)} tasks", 3000)
-        
-        return tasks
+        self.statusBar().showMessage(f"Loaded {self.task_model.rowCount()} tasks", 3000)
+    
+    def _on_load_failed(self, params, message):
+        """Report a load that failed and let the list request pages again."""
+        if params.counts_only:
+            if params.generation == self._counts_generation:
+                self.statusBar().showMessage(f"Failed to count tasks: {message}", 5000)
+            return
+        
+        if params.generation != self._load_generation:
+            return
+        
+        self.task_model.cancelFetch()
+        self.statusBar().showMessage(f"Failed to load tasks: {message}", 5000)
     
-    def update_tasks_list(self, tasks):
+    def update_tasks_list(self, tasks, has_more=False):
         """Update the tasks list with the given tasks."""
-        self.tasks_list.clear()
-        for task in tasks:
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 80))  # Set fixed height for each item
-            
-            task_widget = TaskItemWidget(task, self)
-            self.tasks_list.addItem(item)
-            self.tasks_list.setItemWidget(item, task_widget)
+        # A diff can insert and remove many row ranges; repaint once at the end
+        self.tasks_list.setUpdatesEnabled(False)
+        try:
+            self.task_model.setTasks(tasks, has_more)
+        finally:
+            self.tasks_list.setUpdatesEnabled(True)
+    
+    def confirm_delete_task(self, task):
+        """Ask for confirmation before deleting a task."""
+        reply = QMessageBox.question(
+            self, 'Delete Task',
+            f'Are you sure you want to delete "{task.title}"?',
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            self.delete_task(task.id)
+    
+    def delete_task(self, task_id):
+        """Delete a task and remove its row from the list.
+        
+        Deleting a task cannot change which other tasks are shown or their
+        order, so the list is not reloaded.
+        """
+        if get_db().delete_task(task_id):
+            self.statusBar().showMessage("Task deleted successfully!", 3000)
+            self._refresh_dashboard()
+            self.task_model.removeTask(task_id)
+        else:
+            self.statusBar().showMessage("Failed to delete task", 3000)
     
     def on_tab_changed(self, index):
         """Handle tab change event."""
         if index == 0:  # Dashboard tab
-            # Update dashboard with all tasks
-            tasks = db.get_tasks()
-            self.dashboard.update_stats(tasks)
+            # Tasks become overdue as time passes without any write, so the
+            # counts are queried again on every switch. Only the counts are
+            # loaded; the hidden task list is left alone.
+            self._refresh_dashboard()
     
     def show_new_task_dialog(self):
         """Show the new task dialog."""
+        # The dialog module is only needed once a dialog is opened, so it is
+        # not imported at startup
+        from .dialogs.task_dialog import TaskDialog
+        
         dialog = TaskDialog(parent=self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             task = dialog.get_task()
-            task_id = db.add_task(task)
+            task_id = get_db().add_task(task)
             if task_id:
                 self.statusBar().showMessage("Task created successfully!", 3000)
-                self.load_tasks()
+                self._refresh_dashboard()
+                self.load_tasks(self.search_box.text())
             else:
                 self.statusBar().showMessage("Failed to create task", 3000)
     
+    def apply_styles(self):
+        """Apply the default (light) window stylesheet."""
+        self.setStyleSheet(self._LIGHT_QSS)
+    
     def toggle_dark_mode(self, checked):
         """Toggle dark mode."""
-        # TODO: Implement dark mode
-        if checked:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background: #121212;
-                    color: #ffffff;
-                }
-                #sidebar {
-                    background: #1e1e1e;
-                    border-right: 1px solid #333;
-                }
-                QListWidget {
-                    background: #1e1e1e;
-                    color: #ffffff;
-                }
-            """)
-        else:
-            self.apply_styles()
+        self.setStyleSheet(self._DARK_QSS if checked else self._LIGHT_QSS)
@@ -0,0 +1,84 @@
+"""Background task loading for TaskMaster Pro.
+
+This module contains the runnable that queries the task list on a
+QThreadPool worker so that database access never blocks the GUI thread.
+"""
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..db.database import get_db
+
+
+@dataclass(frozen=True)
+class LoaderParams:
+    """Snapshot of the list state a load was requested for.
+    
+    Widgets may only be read on the GUI thread, so everything the worker
+    needs is captured here before the load is started.
+    """
+    generation: int
+    filter_name: str = 'all'
+    filter_text: Optional[str] = None
+    sort_by: str = 'due_date'
+    # Reference time for the date based filters, read once per load
+    now: Optional[datetime] = None
+    # Page of the list to load
+    limit: Optional[int] = None
+    offset: int = 0
+    # Whether to only count the tasks for the dashboard instead of loading
+    # the task list
+    counts_only: bool = False
+    
+    def next_page(self, offset):
+        """Get the parameters for loading the page starting at offset."""
+        return replace(self, offset=offset)
+
+
+class TaskLoaderSignals(QObject):
+    """Signals emitted by TaskLoader.
+    
+    QRunnable is not a QObject, so the signals live on a separate object.
+    """
+    
+    # Emitted with the LoaderParams, the page of filtered and sorted tasks
+    # and None, or for a counts only load an empty list and the task counts
+    finished = pyqtSignal(object, list, object)
+    
+    # Emitted with the LoaderParams and an error message if the load failed
+    failed = pyqtSignal(object, str)
+
+
+class TaskLoader(QRunnable):
+    """Queries the task list on a thread pool worker."""
+    
+    def __init__(self, params):
+        super().__init__()
+        self.params = params
+        self.signals = TaskLoaderSignals()
+    
+    def run(self):
+        """Fetch the tasks and emit them for the GUI thread to display."""
+        params = self.params
+        
+        # An exception escaping run() would abort the whole application, and
+        # the list must learn that the load is over either way
+        try:
+            # The database serializes access to its connection, so it can be
+            # shared with the worker threads
+            db = get_db()
+            
+            if params.counts_only:
+                tasks, task_counts = [], db.get_task_counts(params.now)
+            else:
+                # Filtering, searching and sorting are done by the database
+                tasks = db.query_tasks(params.filter_name, params.filter_text, params.sort_by,
+                                       params.limit, params.offset, params.now)
+                task_counts = None
+        except Exception as e:
+            self.signals.failed.emit(params, str(e))
+            return
+        
+        self.signals.finished.emit(params, tasks, task_counts)
@@ -2,8 +2,22 @@
 Widgets package for TaskMaster Pro.
 
 This package contains custom widgets used throughout the application.
+Widgets are imported on first access, since QtCharts is slow to load.
 """
+import importlib
 
-from .dashboard_widget import DashboardWidget
+__all__ = ['DashboardWidget', 'TaskListModel', 'TaskItemDelegate']
 
-__all__ = ['DashboardWidget']
+# Maps exported names to the submodule that defines them
+_WIDGET_MODULES = {
+    'DashboardWidget': '.dashboard_widget',
+    'TaskListModel': '.task_list',
+    'TaskItemDelegate': '.task_list',
+}
+
+
+def __getattr__(name):
+    """Lazily import widget classes (PEP 562)."""
+    if name in _WIDGET_MODULES:
+        return getattr(importlib.import_module(_WIDGET_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,6 +16,8 @@ class DashboardWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Counts shown by the last update, to skip updates that change nothing
+        self._last_counts = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -26,10 +28,14 @@ class DashboardWidget(QWidget):
         
         # Stats cards row
         stats_layout = QHBoxLayout()
-        self.total_tasks_card = self.create_stat_card("Total Tasks", "0", "#4CAF50")
-        self.completed_card = self.create_stat_card("Completed", "0", "#2196F3")
-        self.in_progress_card = self.create_stat_card("In Progress", "0", "#FFC107")
-        self.overdue_card = self.create_stat_card("Overdue", "0", "#F44336")
+        self.total_tasks_card, self.total_value_label = self.create_stat_card(
+            "Total Tasks", "0", "#4CAF50")
+        self.completed_card, self.completed_value_label = self.create_stat_card(
+            "Completed", "0", "#2196F3")
+        self.in_progress_card, self.in_progress_value_label = self.create_stat_card(
+            "In Progress", "0", "#FFC107")
+        self.overdue_card, self.overdue_value_label = self.create_stat_card(
+            "Overdue", "0", "#F44336")
         
         stats_layout.addWidget(self.total_tasks_card)
         stats_layout.addWidget(self.completed_card)
@@ -55,7 +61,11 @@ class DashboardWidget(QWidget):
         layout.addLayout(charts_layout, 1)
         
     def create_stat_card(self, title, value, color):
-        """Create a stat card widget."""
+        """Create a stat card widget.
+        
+        Returns:
+            tuple: The card and the label showing its value.
+        """
         card = QFrame()
         card.setFrameShape(QFrame.Shape.StyledPanel)
         card.setStyleSheet(f"""
@@ -87,11 +97,11 @@ class DashboardWidget(QWidget):
         layout.addWidget(title_label)
         layout.addStretch()
         
-        return card
+        return card, value_label
         
     def create_priority_chart(self):
         """Create a pie chart showing task distribution by priority."""
-        series = QPieSeries()
+        series = self.priority_series = QPieSeries()
         series.append("High", 0)
         series.append("Medium", 0)
         series.append("Low", 0)
@@ -103,7 +113,7 @@ class DashboardWidget(QWidget):
         slices[2].setColor("#8BC34A")  # Green for low
         
         # Create chart
-        chart = QChart()
+        chart = self.priority_chart = QChart()
         chart.addSeries(series)
         chart.setTitle("Tasks by Priority")
         chart.legend().setVisible(True)
@@ -119,7 +129,7 @@ class DashboardWidget(QWidget):
     def create_status_chart(self):
         """Create a bar chart showing task distribution by status."""
         # Create bars
-        bar_set = QBarSet("Tasks")
+        bar_set = self.status_bar_set = QBarSet("Tasks")
         bar_set << 0 << 0 << 0  # Placeholder values for Not Started, In Progress, Completed
         
         # Set colors
@@ -130,7 +140,7 @@ class DashboardWidget(QWidget):
         series.append(bar_set)
         
         # Create chart
-        chart = QChart()
+        chart = self.status_chart = QChart()
         chart.addSeries(series)
         chart.setTitle("Tasks by Status")
         chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
@@ -142,7 +152,7 @@ class DashboardWidget(QWidget):
         chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
         series.attachAxis(axis_x)
         
-        axis_y = QValueAxis()
+        axis_y = self.status_axis_y = QValueAxis()
         axis_y.setRange(0, 10)  # Will be updated with actual data
         chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
         series.attachAxis(axis_y)
@@ -155,47 +165,73 @@ class DashboardWidget(QWidget):
         
         return chart_view
         
-    def update_stats(self, tasks):
-        """Update dashboard statistics with the given tasks."""
-        if not tasks:
-            return
+    def update_stats(self, task_counts):
+        """Update dashboard statistics.
+        
+        Args:
+            task_counts: (status, priority, task count, overdue task count)
+                tuples as returned by Database.get_task_counts
+        """
+        # Sum the per status and priority counts up in a single pass
+        total = completed = in_progress = not_started = overdue = 0
+        high = medium = low = 0
+        for status, priority, count, overdue_count in task_counts:
+            total += count
+            overdue += overdue_count
             
-        total = len(tasks)
-        completed = sum(1 for t in tasks if t.status == Status.COMPLETED)
-        in_progress = sum(1 for t in tasks if t.status == Status.IN_PROGRESS)
-        overdue = sum(1 for t in tasks if t.due_date and t.due_date < datetime.now() and t.status != Status.COMPLETED)
-        
+            if status is Status.COMPLETED:
+                completed += count
+            elif status is Status.IN_PROGRESS:
+                in_progress += count
+            elif status is Status.TODO:
+                not_started += count
+            
+            if priority is Priority.HIGH:
+                high += count
+            elif priority is Priority.MEDIUM:
+                medium += count
+            elif priority is Priority.LOW:
+                low += count
+        
+        # Setting chart values restarts their animations even when the value
+        # is the same, so nothing is touched unless a count changed
+        counts = (total, completed, in_progress, not_started, overdue, high, medium, low)
+        if counts == self._last_counts:
+            return
+        self._last_counts = counts
+        
+        # Apply the new values without animating them; animating every
+        # refresh is costly and adds nothing to a set of counters. Updates
+        # are held back so the labels and charts are repainted together.
+        charts = (self.priority_chart, self.status_chart)
+        for chart in charts:
+            chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+        self.setUpdatesEnabled(False)
+        try:
+            self._show_counts(*counts)
+        finally:
+            self.setUpdatesEnabled(True)
+            for chart in charts:
+                chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+    
+    def _show_counts(self, total, completed, in_progress, not_started, overdue, high, medium, low):
+        """Show task counts on the stat cards and charts."""
         # Update stat cards
-        self.total_tasks_card.findChild(QLabel, "value").setText(str(total))
-        self.completed_card.findChild(QLabel, "value").setText(str(completed))
-        self.in_progress_card.findChild(QLabel, "value").setText(str(in_progress))
-        self.overdue_card.findChild(QLabel, "value").setText(str(overdue))
+        self.total_value_label.setText(str(total))
+        self.completed_value_label.setText(str(completed))
+        self.in_progress_value_label.setText(str(in_progress))
+        self.overdue_value_label.setText(str(overdue))
         
         # Update priority chart
-        priority_chart = self.findChild(QChartView).chart()
-        if priority_chart and priority_chart.series():
-            series = priority_chart.series()[0]
-            high = sum(1 for t in tasks if t.priority == Priority.HIGH)
-            medium = sum(1 for t in tasks if t.priority == Priority.MEDIUM)
-            low = sum(1 for t in tasks if t.priority == Priority.LOW)
-            
-            for i, count in enumerate([high, medium, low]):
-                series.slices()[i].setValue(count)
+        for slice_, count in zip(self.priority_series.slices(), (high, medium, low)):
+            slice_.setValue(count)
         
         # Update status chart
-        status_chart = self.findChildren(QChartView)[1].chart()
-        if status_chart and status_chart.series():
-            series = status_chart.series()[0]
-            bar_set = series.barSets()[0]
-            
-            not_started = sum(1 for t in tasks if t.status == Status.NOT_STARTED)
-            in_progress = sum(1 for t in tasks if t.status == Status.IN_PROGRESS)
-            completed = sum(1 for t in tasks if t.status == Status.COMPLETED)
-            
-            bar_set.replace(0, not_started)
-            bar_set.replace(1, in_progress)
-            bar_set.replace(2, completed)
-            
-            # Update Y-axis range
-            max_value = max(not_started, in_progress, completed, 1)  # At least 1 to avoid division by zero
-            status_chart.axisY().setRange(0, max_value * 1.2)  # Add 20% padding
+        self.status_bar_set.replace(0, not_started)
+        self.status_bar_set.replace(1, in_progress)
+        self.status_bar_set.replace(2, completed)
+        
+        # Update Y-axis range
+        max_value = max(not_started, in_progress, completed, 1)  # At least 1 to avoid division by zero
+        if self.status_axis_y.max() != max_value * 1.2:
+            self.status_axis_y.setRange(0, max_value * 1.2)  # Add 20% padding
@@ -0,0 +1,351 @@
+"""Task list model and delegate for TaskMaster Pro.
+
+This module contains the model that exposes tasks to a QListView and the
+delegate that paints each task row. Rows are painted directly instead of
+being built from child widgets, so only the visible rows cost anything.
+"""
+import functools
+from difflib import SequenceMatcher
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QSize, QRect, QEvent, pyqtSignal
+)
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics
+
+from ...models.task import Status, Priority
+from .. import icon_cache
+
+
+# Glyph and color of the status icon for each status
+STATUS_ICONS = {
+    Status.COMPLETED: ('fa5s.check-circle', '#4CAF50'),
+    Status.IN_PROGRESS: ('fa5s.spinner', '#2196F3'),
+}
+DEFAULT_STATUS_ICON = ('fa5s.circle', '#9E9E9E')
+
+PRIORITY_COLORS = {
+    Priority.HIGH: QColor('#F44336'),
+    Priority.MEDIUM: QColor('#FFC107'),
+    Priority.LOW: QColor('#8BC34A')
+}
+DEFAULT_PRIORITY_COLOR = QColor('#9E9E9E')
+
+# Row colors, created once instead of on every paint
+ROW_BACKGROUND = QColor('white')
+ROW_HOVER_BACKGROUND = QColor('#f5f5f5')
+ROW_SELECTED_BACKGROUND = QColor('#e3f2fd')
+ROW_SEPARATOR_COLOR = QColor('#eee')
+TITLE_COLOR = QColor('#333')
+DETAILS_COLOR = QColor('#666')
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_due_date(due_date):
+    """Format a due date for display, once per distinct date."""
+    return due_date.strftime('%b %d, %Y %H:%M')
+
+
+class TaskListModel(QAbstractListModel):
+    """List model holding the tasks shown in the task list.
+    
+    The Task object of a row is available through TaskRole and its fields
+    through the other custom roles.
+    
+    The model can hold the first pages of a longer list. When the view
+    scrolls to the end and more tasks exist, it emits fetchMoreRequested
+    and the owner loads the next page and passes it to appendTasks.
+    """
+    
+    # Emitted with the number of rows loaded so far, i.e. the offset of the
+    # next page, when the view wants more rows
+    fetchMoreRequested = pyqtSignal(int)
+    
+    TaskRole = Qt.ItemDataRole.UserRole
+    DueDateRole = Qt.ItemDataRole.UserRole + 1
+    TagsRole = Qt.ItemDataRole.UserRole + 2
+    StatusRole = Qt.ItemDataRole.UserRole + 3
+    PriorityRole = Qt.ItemDataRole.UserRole + 4
+    
+    def __init__(self, tasks=None, parent=None):
+        super().__init__(parent)
+        self._tasks = list(tasks or [])
+        self._has_more = False
+        self._fetching = False
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of tasks in the model."""
+        return 0 if parent.isValid() else len(self._tasks)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the data for a task row."""
+        if not index.isValid():
+            return None
+        
+        task = self._tasks[index.row()]
+        if role == self.TaskRole:
+            return task
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task.title
+        if role == self.DueDateRole:
+            return task.due_date
+        if role == self.TagsRole:
+            return task.tags
+        if role == self.StatusRole:
+            return task.status
+        if role == self.PriorityRole:
+            return task.priority
+        return None
+    
+    def roleNames(self):
+        """Return the names of the roles, including the custom ones."""
+        names = super().roleNames()
+        names.update({
+            self.TaskRole: b'task',
+            self.DueDateRole: b'dueDate',
+            self.TagsRole: b'tags',
+            self.StatusRole: b'status',
+            self.PriorityRole: b'priority'
+        })
+        return names
+    
+    def removeTask(self, task_id):
+        """Remove the row of a task.
+        
+        Returns:
+            bool: True if the task was shown and its row removed.
+        """
+        row = self._row_of(task_id)
+        if row is None:
+            return False
+        
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        self.endRemoveRows()
+        return True
+    
+    def refreshTask(self, task_id):
+        """Repaint the row of a task that was changed in place."""
+        row = self._row_of(task_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        """Return whether more tasks exist than have been loaded."""
+        return not parent.isValid() and self._has_more and not self._fetching
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Ask the owner for the next page of tasks."""
+        if self.canFetchMore(parent):
+            self._fetching = True
+            self.fetchMoreRequested.emit(len(self._tasks))
+    
+    def cancelFetch(self):
+        """Allow fetching again after a requested page failed to load."""
+        self._fetching = False
+    
+    def appendTasks(self, tasks, has_more=False):
+        """Add a page of tasks to the end of the list.
+        
+        Args:
+            tasks: The tasks of the page
+            has_more: Whether more tasks exist after this page
+        """
+        self._has_more = has_more
+        self._fetching = False
+        if not tasks:
+            return
+        
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        self._tasks.extend(tasks)
+        self.endInsertRows()
+    
+    def _row_of(self, task_id):
+        """Get the row of a task, or None if it is not shown."""
+        return next((row for row, task in enumerate(self._tasks) if task.id == task_id), None)
+    
+    def setTasks(self, tasks, has_more=False):
+        """Replace the tasks shown by the model.
+        
+        The old and new rows are diffed by task id and only the rows that
+        differ are removed or inserted, so the view keeps its selection and
+        scroll position and only repaints what changed.
+        
+        Args:
+            tasks: The tasks to show
+            has_more: Whether more tasks exist after these
+        """
+        self._has_more = has_more
+        self._fetching = False
+        
+        new_tasks = list(tasks)
+        if not self._tasks or not new_tasks:
+            # Nothing to preserve, a reset is cheapest
+            self.beginResetModel()
+            self._tasks = new_tasks
+            self.endResetModel()
+            return
+        
+        matcher = SequenceMatcher(None, [t.id for t in self._tasks],
+                                  [t.id for t in new_tasks], autojunk=False)
+        
+        # Apply the edits back to front so the row numbers of the edits
+        # still to come are not shifted
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == 'equal' or (tag == 'replace' and i2 - i1 == j2 - j1):
+                # Same rows, possibly with edited task data
+                self._tasks[i1:i2] = new_tasks[j1:j2]
+                self.dataChanged.emit(self.index(i1), self.index(i2 - 1))
+                continue
+            
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self._tasks[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self._tasks[i1:i1] = new_tasks[j1:j2]
+                self.endInsertRows()
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """Paints a task row: status icon, title, details, priority and delete button."""
+    
+    # Emitted with the Task whose delete button was clicked
+    deleteRequested = pyqtSignal(object)
+    
+    ROW_HEIGHT = 80
+    ICON_SIZE = 24
+    DELETE_BUTTON_SIZE = 30
+    PRIORITY_DOT_SIZE = 10
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Fonts and metrics for the view's font, see _get_fonts
+        self._base_font = None
+        self._fonts = None
+    
+    def sizeHint(self, option, index):
+        """Return the fixed size of a task row."""
+        return QSize(0, self.ROW_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        """Paint a single task row."""
+        task = index.data(TaskListModel.TaskRole)
+        if task is None:
+            return
+        
+        painter.save()
+        rect = option.rect
+        
+        # Background and separator
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, ROW_SELECTED_BACKGROUND)
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(rect, ROW_HOVER_BACKGROUND)
+        else:
+            painter.fillRect(rect, ROW_BACKGROUND)
+        painter.setPen(ROW_SEPARATOR_COLOR)
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        
+        content = rect.adjusted(10, 5, -10, -5)
+        center_y = content.center().y()
+        
+        # Status indicator
+        icon_rect = QRect(content.left(), center_y - self.ICON_SIZE // 2,
+                          self.ICON_SIZE, self.ICON_SIZE)
+        painter.drawPixmap(icon_rect, self._get_status_icon(task))
+        
+        # Delete button
+        delete_rect = self._delete_button_rect(rect)
+        painter.drawPixmap(delete_rect.center().x() - 8, delete_rect.center().y() - 8,
+                           icon_cache.pixmap('fa5s.trash', '#ff6b6b', 16, 16))
+        
+        # Priority indicator
+        dot_rect = QRect(delete_rect.left() - 10 - self.PRIORITY_DOT_SIZE,
+                         center_y - self.PRIORITY_DOT_SIZE // 2,
+                         self.PRIORITY_DOT_SIZE, self.PRIORITY_DOT_SIZE)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._get_priority_color(task))
+        painter.drawEllipse(dot_rect)
+        
+        # Task title and details
+        text_left = icon_rect.right() + 10
+        text_width = dot_rect.left() - 10 - text_left
+        
+        title_font, title_metrics, details_font, details_metrics = self._get_fonts(option.font)
+        
+        details = []
+        if task.due_date:
+            details.append(f"Due: {_format_due_date(task.due_date)}")
+        if task.tags:
+            details.append(f"Tags: {', '.join(task.tags)}")
+        
+        text_height = title_metrics.height() + 2 + details_metrics.height()
+        title_rect = QRect(text_left, center_y - text_height // 2,
+                           text_width, title_metrics.height())
+        details_rect = QRect(text_left, title_rect.bottom() + 2,
+                             text_width, details_metrics.height())
+        
+        painter.setFont(title_font)
+        painter.setPen(TITLE_COLOR)
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         title_metrics.elidedText(task.title, Qt.TextElideMode.ElideRight, text_width))
+        
+        painter.setFont(details_font)
+        painter.setPen(DETAILS_COLOR)
+        painter.drawText(details_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         details_metrics.elidedText(" • ".join(details), Qt.TextElideMode.ElideRight,
+                                                    text_width))
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        """Emit deleteRequested when the delete button of a row is clicked."""
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._delete_button_rect(option.rect).contains(event.position().toPoint())):
+            task = index.data(TaskListModel.TaskRole)
+            if task is not None:
+                self.deleteRequested.emit(task)
+            return True
+        return super().editorEvent(event, model, option, index)
+    
+    def _get_fonts(self, base_font):
+        """Get the title and details fonts and their metrics.
+        
+        They are derived from the view's font and only rebuilt when that
+        font changes, instead of on every paint.
+        
+        Returns:
+            tuple: Title font, title metrics, details font, details metrics.
+        """
+        if self._fonts is None or base_font != self._base_font:
+            title_font = QFont(base_font)
+            title_font.setBold(True)
+            title_font.setPointSize(12)
+            
+            details_font = QFont(base_font)
+            details_font.setPointSize(10)
+            
+            self._base_font = QFont(base_font)
+            self._fonts = (title_font, QFontMetrics(title_font),
+                           details_font, QFontMetrics(details_font))
+        return self._fonts
+    
+    def _delete_button_rect(self, rect):
+        """Get the area of the delete button within a row."""
+        size = self.DELETE_BUTTON_SIZE
+        return QRect(rect.right() - 10 - size, rect.center().y() - size // 2, size, size)
+    
+    def _get_status_icon(self, task):
+        """Get the appropriate status icon for the task."""
+        name, color = STATUS_ICONS.get(task.status, DEFAULT_STATUS_ICON)
+        return icon_cache.pixmap(name, color, self.ICON_SIZE, self.ICON_SIZE)
+    
+    def _get_priority_color(self, task):
+        """Get the color for the priority indicator."""
+        return PRIORITY_COLORS.get(task.priority, DEFAULT_PRIORITY_COLOR)